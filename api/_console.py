@@ -0,0 +1,16 @@
+import sys
+
+from rich.console import Console
+
+
+# One console per process. Automatic highlighting is off: table cells and
+# messages are already styled, and the highlighter would otherwise regex-scan
+# every printed string. When stdout is not a TTY, force_terminal is left as None
+# so Rich's own detection (FORCE_COLOR, TTY_COMPATIBLE, Jupyter, ...) decides,
+# and color_system="auto" only picks up COLORTERM when writing to a terminal.
+CONSOLE = Console(
+    force_terminal=True if sys.stdout.isatty() else None,
+    color_system="auto",
+    highlight=False,
+    markup=True,
+)
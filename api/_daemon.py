@@ -0,0 +1,176 @@
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+import traceback
+
+
+# The daemon and the crabpot.py shim only share this module, so it must stay
+# stdlib-only and cheap to import.
+def socket_path() -> str:
+    """Return the daemon socket path inside a private per-user directory.
+
+    Raises PermissionError if that directory is not a real directory owned by
+    the current user with no group/other access, since anyone who could place
+    a socket there would receive the caller's environment and stdio.
+    """
+    directory = os.getenv("XDG_RUNTIME_DIR")
+    if not directory:
+        directory = f"/tmp/crab-pot-{os.getuid()}"
+        try:
+            os.mkdir(directory, 0o700)
+        except FileExistsError:
+            pass
+
+    st = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(st.st_mode)
+        or st.st_uid != os.getuid()
+        or st.st_mode & 0o077
+    ):
+        raise PermissionError(
+            f"{directory} is not a private directory owned by the current user"
+        )
+
+    return os.path.join(directory, "crab-pot.sock")
+
+
+def peer_uid(sock: socket.socket) -> int:
+    creds = sock.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid
+
+
+def _preload():
+    # Third-party imports only: our own modules read the environment at import
+    # time, so they are imported per command, after the caller's env is applied.
+    import asyncio
+
+    import httpx
+    import ijson
+    import msgspec
+    import rich.console
+    import rich.json
+    import rich.table
+
+
+def _is_running(path: str) -> bool:
+    with socket.socket(socket.AF_UNIX) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("crabpot disconnected mid-request")
+        data += chunk
+    return data
+
+
+def _watch_peer(conn: socket.socket) -> None:
+    # After the request, the shim only sends numbers of signals it received.
+    # EOF means the shim is gone and nobody is waiting for this command.
+    while data := conn.recv(16):
+        for signum in data:
+            os.kill(os.getpid(), signum)
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+def _handle(conn: socket.socket, app) -> None:
+    import threading
+
+    if peer_uid(conn) != os.getuid():
+        return
+
+    # The request is a 4-byte length (sent along with the shim's stdio fds)
+    # followed by that many bytes of JSON.
+    header, fds, _, _ = socket.recv_fds(conn, 4, 3)
+    header += _recv_exact(conn, 4 - len(header))
+    (length,) = struct.unpack("!I", header)
+    request = json.loads(_recv_exact(conn, length))
+
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+
+    threading.Thread(target=_watch_peer, args=(conn,), daemon=True).start()
+
+    try:
+        app(request["argv"], prog_name="crab-pot")
+        code = 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    conn.sendall(str(code).encode())
+
+
+def serve(app) -> None:
+    """Fork a background daemon that runs CLI commands sent by crabpot.py.
+
+    Heavy imports happen once in the daemon; every command then runs in a
+    forked child with the caller's stdio, cwd and environment.
+    """
+    try:
+        path = socket_path()
+    except PermissionError as e:
+        print(f"Refusing to start crab-pot daemon: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if _is_running(path):
+        print(f"crab-pot daemon already listening on {path}", file=sys.stderr)
+        sys.exit(1)
+
+    # Only a leftover socket from a previous daemon is replaced.
+    if os.path.lexists(path):
+        if not stat.S_ISSOCK(os.lstat(path).st_mode):
+            print(f"Refusing to replace {path}: not a socket", file=sys.stderr)
+            sys.exit(1)
+        os.unlink(path)
+
+    _preload()
+
+    server = socket.socket(socket.AF_UNIX)
+    server.bind(path)
+    os.chmod(path, 0o600)
+    server.listen()
+
+    if os.fork():
+        print(f"crab-pot daemon listening on {path}")
+        return
+
+    os.setsid()
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    while True:
+        conn, _ = server.accept()
+        if os.fork():
+            conn.close()
+            continue
+
+        server.close()
+        try:
+            _handle(conn, app)
+        finally:
+            os._exit(0)
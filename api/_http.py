@@ -0,0 +1,149 @@
+import atexit
+import functools
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from _version import __version__
+
+
+API_KEY = os.getenv("LOG_SERVER_API_KEY", "secret-key")
+BASE_URL = "http://localhost:8081"
+
+_HEADERS = {
+    "X-Api-Key": API_KEY,
+    "Accept": "application/json",
+    "User-Agent": f"crab-pot/{__version__}",
+}
+
+# Schemas change rarely, so GETs to /schemas* are served from a small on-disk
+# cache for CACHE_TTL seconds and revalidated with If-None-Match afterwards.
+# Entries older than CACHE_MAX_AGE are dropped rather than served as a fallback,
+# and only the CACHE_MAX_ENTRIES most recently refreshed ones are kept.
+CACHE_TTL = 30.0
+CACHE_MAX_AGE = 24 * 60 * 60.0
+CACHE_MAX_ENTRIES = 64
+CACHE_PATH = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "crab-pot"
+    / "schemas.json"
+)
+
+
+def _client_options() -> dict:
+    import httpx
+
+    return {
+        "base_url": BASE_URL,
+        "headers": _HEADERS,
+        # Responses are always JSON; never guess the charset of a body that
+        # arrives without one.
+        "default_encoding": "utf-8",
+        "limits": httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        "timeout": 30.0,
+    }
+
+
+# One keep-alive client is shared by every module in the process. httpx is only
+# imported once a command actually issues a request, so `--help` and argument
+# errors stay cheap.
+@functools.cache
+def get_client():
+    import httpx
+
+    client = httpx.Client(**_client_options())
+    atexit.register(client.close)
+    return client
+
+
+# An AsyncClient is bound to the event loop it first runs on, so unlike the
+# sync client it is not cached; use it as `async with get_async_client()`.
+def get_async_client():
+    import httpx
+
+    return httpx.AsyncClient(**_client_options())
+
+
+def _cache_key(url: str) -> str:
+    # Entries are scoped to the server and API key they were fetched with, so a
+    # different or revoked key never reads responses cached for another one.
+    scope = hashlib.sha256(f"{BASE_URL}\0{API_KEY}".encode()).hexdigest()[:16]
+    return f"{scope} {url}"
+
+
+def _is_valid_entry(entry) -> bool:
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("timestamp"), (int, float))
+        and isinstance(entry.get("etag"), (str, type(None)))
+        and isinstance(entry.get("body"), str)
+    )
+
+
+def _load_cache() -> dict:
+    try:
+        cache = json.loads(CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(cache, dict):
+        return {}
+
+    now = time.time()
+    return {
+        key: entry
+        for key, entry in cache.items()
+        if _is_valid_entry(entry) and now - entry["timestamp"] < CACHE_MAX_AGE
+    }
+
+
+def _save_cache(cache: dict) -> None:
+    newest = sorted(cache.items(), key=lambda item: item[1]["timestamp"], reverse=True)
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CACHE_PATH.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(dict(newest[:CACHE_MAX_ENTRIES])))
+        tmp_path.replace(CACHE_PATH)
+    except OSError:
+        pass
+
+
+def get_cached(path: str, params: dict | None = None) -> bytes:
+    """GET `path` through the schema cache and return the response body.
+
+    Fresh entries are returned without touching the network, stale ones are
+    revalidated, and if the server cannot be reached a stale body is returned
+    instead of failing.
+    """
+    import httpx
+
+    key = _cache_key(str(httpx.URL(path, params=params)))
+    cache = _load_cache()
+    entry = cache.get(key)
+
+    if entry and time.time() - entry["timestamp"] < CACHE_TTL:
+        return entry["body"].encode()
+
+    headers = {"If-None-Match": entry["etag"]} if entry and entry["etag"] else {}
+    try:
+        response = get_client().get(path, params=params, headers=headers)
+    except httpx.RequestError:
+        if entry:
+            return entry["body"].encode()
+        raise
+
+    if entry and response.status_code == 304:
+        entry["timestamp"] = time.time()
+    else:
+        response.raise_for_status()
+        entry = {
+            "timestamp": time.time(),
+            "etag": response.headers.get("ETag"),
+            "body": response.text,
+        }
+
+    cache[key] = entry
+    _save_cache(cache)
+    return entry["body"].encode()
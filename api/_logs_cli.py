@@ -0,0 +1,109 @@
+import typer
+
+from _console import CONSOLE
+from _http import get_async_client
+
+
+app = typer.Typer()
+
+
+async def _stream_logs(client, schema_name: str, params: dict, parse) -> list:
+    import ijson
+
+    # Items are parsed incrementally as chunks arrive, so the raw body is never
+    # held in memory alongside the parsed logs.
+    logs = []
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, "logs.item", use_float=True)
+
+    url = f"/logs/schema/{schema_name}"
+    async with client.stream("GET", url, params=params) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            parser.send(chunk)
+            logs.extend(map(parse, items))
+            del items[:]
+
+    parser.close()
+    logs.extend(map(parse, items))
+    return logs
+
+
+async def _fetch_logs(schema_names: list[str], params: dict, parse) -> list[list]:
+    import asyncio
+
+    async with get_async_client() as client:
+        return await asyncio.gather(
+            *(_stream_logs(client, name, params, parse) for name in schema_names)
+        )
+
+
+@app.command("list")
+def list_logs(
+    schema_names: list[str] = typer.Argument(
+        None, help="Schema names to fetch logs for"
+    ),
+    full: bool = typer.Option(False, "--full", "-f", help="Show full UUIDs"),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+    expand: bool = typer.Option(
+        False, "--expand", "-e", help="Show full log data (pretty-printed)"
+    ),
+    limit: int = typer.Option(
+        10, "--limit", "-l", help="Maximum number of logs to retrieve per schema"
+    ),
+):
+    import asyncio
+
+    import httpx
+    from rich.table import Table
+    from _models import Log
+
+    if not schema_names:
+        CONSOLE.print("[red]Error: at least one schema name is required[/red]")
+        raise typer.Exit(1)
+
+    try:
+        params = {"limit": limit}
+
+        # The server already returns valid JSON, so --json skips model validation.
+        if json_output:
+            logs_per_schema = asyncio.run(_fetch_logs(schema_names, params, dict))
+            logs_data = [log for logs in logs_per_schema for log in logs]
+
+            if not logs_data:
+                CONSOLE.print(
+                    f"[yellow]No logs found for schema '{', '.join(schema_names)}'[/yellow]"
+                )
+                return
+
+            CONSOLE.print_json(data=logs_data)
+            return
+
+        logs_per_schema = asyncio.run(
+            _fetch_logs(schema_names, params, Log.from_api_response)
+        )
+
+        to_table_row = Log.to_table_row_expanded if expand else Log.to_table_row
+
+        for schema_name, logs in zip(schema_names, logs_per_schema):
+            if not logs:
+                CONSOLE.print(
+                    f"[yellow]No logs found for schema '{schema_name}'[/yellow]"
+                )
+                continue
+
+            table = Table(title=f"Logs for Schema: {schema_name}")
+            table.add_column("Log ID", style="cyan", no_wrap=True)
+            table.add_column("Schema ID", style="blue", no_wrap=True)
+            table.add_column("Created At", style="green")
+            table.add_column("Data Preview", style="white")
+
+            add_row = table.add_row
+            for row in [to_table_row(log, full_id=full) for log in logs]:
+                add_row(*row)
+
+            CONSOLE.print(table)
+
+    except httpx.HTTPError as e:
+        CONSOLE.print(f"[red]Error fetching logs: {e}[/red]")
+        raise typer.Exit(1)
@@ -0,0 +1,101 @@
+import uuid
+from datetime import datetime
+from functools import cached_property
+from typing import Any
+
+import msgspec
+from rich.json import JSON
+
+
+def format_timestamp(value: datetime) -> str:
+    # Same output as strftime("%Y-%m-%d %H:%M:%S") without parsing a format
+    # string on every row; tzinfo is dropped so no UTC offset is appended.
+    return value.replace(tzinfo=None).isoformat(sep=" ", timespec="seconds")
+
+
+# msgspec decodes JSON straight into these structs without a dict
+# intermediate. dict=True gives instances a __dict__ so cached_property works.
+class _Model(msgspec.Struct, frozen=True, dict=True):
+    @classmethod
+    def from_api_response(cls, data: dict):
+        return msgspec.convert(data, cls)
+
+    @classmethod
+    def from_json(cls, body: bytes):
+        return msgspec.json.decode(body, type=cls)
+
+    def to_builtins(self) -> dict:
+        return msgspec.to_builtins(self)
+
+
+class Schema(_Model, kw_only=True):
+    id: uuid.UUID
+    name: str
+    version: str
+    description: str | None = None
+    schema_definition: dict[str, Any]
+    created_at: datetime
+    updated_at: datetime
+
+    # UUID formatting is cached per instance since rows may be rendered
+    # repeatedly.
+    @cached_property
+    def _id_str(self) -> str:
+        return str(self.id)
+
+    @cached_property
+    def _short_id(self) -> str:
+        return self._id_str[:8] + "..."
+
+    def to_table_row(self, full_id: bool = False) -> tuple:
+        schema_id = self._id_str if full_id else self._short_id
+        description = (self.description or "")[:50]
+        return (schema_id, self.name, self.version, description)
+
+
+class Log(_Model):
+    id: int
+    schema_id: uuid.UUID
+    log_data: dict[str, Any]
+    created_at: datetime
+
+    @cached_property
+    def _schema_id_str(self) -> str:
+        return str(self.schema_id)
+
+    @cached_property
+    def _short_schema_id(self) -> str:
+        return self._schema_id_str[:8] + "..."
+
+    def to_table_row(self, full_id: bool = False) -> tuple:
+        schema_id = self._schema_id_str if full_id else self._short_schema_id
+        # Get a preview of the data (first few key-value pairs). The payload is
+        # serialized once in C; a cut multi-byte character is dropped.
+        encoded = msgspec.json.encode(self.log_data)
+        data_preview = encoded[:50].decode(errors="ignore")
+        if len(encoded) > 50:
+            data_preview += "..."
+        return (
+            str(self.id),
+            schema_id,
+            format_timestamp(self.created_at),
+            data_preview,
+        )
+
+    def to_table_row_expanded(self, full_id: bool = False) -> tuple:
+        schema_id = self._schema_id_str if full_id else self._short_schema_id
+
+        # rich.json highlights with a regex highlighter instead of building a
+        # Pygments lexer per row like Syntax does.
+        log_json = JSON.from_data(self.log_data, indent=2)
+
+        return (
+            str(self.id),
+            schema_id,
+            format_timestamp(self.created_at),
+            log_json,
+        )
+
+
+class SchemaList(_Model):
+    schemas: list[Schema] = []
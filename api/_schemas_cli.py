@@ -0,0 +1,149 @@
+import json
+import uuid
+
+import typer
+
+from _console import CONSOLE
+from _http import get_cached
+
+
+app = typer.Typer()
+
+# JSON Schema keywords shown in the "Constraints" column, in display order.
+_CONSTRAINT_FORMATTERS = (
+    ("enum", lambda v: f"enum: [{', '.join(map(str, v))}]"),
+    ("pattern", "pattern: {}".format),
+    ("minLength", "minLength: {}".format),
+    ("maxLength", "maxLength: {}".format),
+    ("minimum", "min: {}".format),
+    ("maximum", "max: {}".format),
+    ("format", "format: {}".format),
+)
+
+
+@app.command("list")
+def list_schemas(
+    full: bool = typer.Option(False, "--full", "-f", help="Show full UUIDs"),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+):
+    from rich.table import Table
+    from _models import SchemaList
+
+    body = get_cached("/schemas")
+
+    # The server already returns valid JSON, so --json skips model validation.
+    if json_output:
+        schemas_data = json.loads(body).get("schemas", [])
+        if not schemas_data:
+            CONSOLE.print("[yellow]No schemas found[/yellow]")
+            return
+
+        CONSOLE.print_json(data=schemas_data)
+        return
+
+    schemas = SchemaList.from_json(body).schemas
+
+    if not schemas:
+        CONSOLE.print("[yellow]No schemas found[/yellow]")
+        return
+
+    table = Table(title="Schemas")
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Name", style="green")
+    table.add_column("Version", style="blue")
+    table.add_column("Description", style="white")
+
+    add_row = table.add_row
+    for row in [schema.to_table_row(full_id=full) for schema in schemas]:
+        add_row(*row)
+
+    CONSOLE.print(table)
+
+
+@app.command("get")
+def get_schema(
+    schema_id: uuid.UUID = typer.Option(None, "--id", help="Schema UUID"),
+    name: str = typer.Option(None, "--name", "-n", help="Schema name"),
+    version: str = typer.Option(
+        None, "--version", "-v", help="Schema version (defaults to latest)"
+    ),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+):
+    from rich.table import Table
+    from _models import Schema, SchemaList, format_timestamp
+
+    if schema_id and name:
+        CONSOLE.print("[red]Error: Cannot specify both --id and --name[/red]")
+        raise typer.Exit(1)
+
+    if schema_id:
+        if version:
+            CONSOLE.print(
+                "[yellow]Warning: --version is ignored when using --id[/yellow]"
+            )
+        schema = Schema.from_json(get_cached(f"/schemas/{schema_id}"))
+    elif name:
+        params = {"name": name}
+        if version:
+            params["version"] = version
+        body = get_cached("/schemas", params=params)
+        schemas_list = SchemaList.from_json(body).schemas
+
+        if not schemas_list:
+            CONSOLE.print(
+                f"[yellow]No schema found with name '{name}'{' and version ' + version if version else ''}[/yellow]"
+            )
+            raise typer.Exit(1)
+
+        schema = schemas_list[0]
+
+        if len(schemas_list) > 1:
+            CONSOLE.print(
+                f"[yellow]Warning: Found {len(schemas_list)} schemas, displaying the first one[/yellow]\n"
+            )
+    else:
+        CONSOLE.print("[red]Error: Must specify either --id or --name[/red]")
+        raise typer.Exit(1)
+
+    if json_output:
+        CONSOLE.print_json(data=schema.to_builtins())
+        return
+
+    schema_def = schema.schema_definition
+    properties = schema_def.get("properties", {})
+    required_fields = schema_def.get("required", [])
+
+    def_table = Table(show_header=True, header_style="bold blue", box=None)
+    def_table.add_column("Field", style="cyan")
+    def_table.add_column("Type", style="green")
+    def_table.add_column("Required", style="yellow", justify="center")
+    def_table.add_column("Constraints", style="white")
+
+    for field_name, field_props in properties.items():
+        field_type = field_props.get("type", "N/A")
+        is_required = "✓" if field_name in required_fields else ""
+
+        constraints = [
+            fmt(field_props[key])
+            for key, fmt in _CONSTRAINT_FORMATTERS
+            if key in field_props
+        ]
+        constraints_str = "\n".join(constraints)
+
+        def_table.add_row(field_name, field_type, is_required, constraints_str)
+
+    table = Table(
+        title=f"Schema: {schema.name}", show_header=True, header_style="bold magenta"
+    )
+    table.add_column("Field", style="cyan", width=20)
+    table.add_column("Value", style="white")
+
+    table.add_row("ID", str(schema.id))
+    table.add_row("Name", schema.name)
+    table.add_row("Version", schema.version)
+    table.add_row("Description", schema.description or "N/A")
+    table.add_row("Created At", format_timestamp(schema.created_at))
+    table.add_row("Updated At", format_timestamp(schema.updated_at))
+    table.add_row("Schema Definition", def_table)
+
+    CONSOLE.print(table)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Thin client for the `main.py serve-cli` daemon.
+
+Forwards argv, environment, working directory and stdio to the daemon over its
+Unix socket and exits with the command's exit code. Falls back to running
+main.py directly when no daemon is listening.
+"""
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+
+from _daemon import peer_uid, socket_path
+
+
+def main() -> int:
+    sock = socket.socket(socket.AF_UNIX)
+    try:
+        sock.connect(socket_path())
+        # Never hand the environment (API key included) and stdio to a
+        # listener run by another user.
+        if peer_uid(sock) != os.getuid():
+            raise PermissionError("crab-pot daemon socket is owned by another user")
+    except OSError as e:
+        sock.close()
+        if isinstance(e, PermissionError):
+            print(f"crabpot: {e}; running without the daemon", file=sys.stderr)
+        main_py = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+        os.execv(sys.executable, [sys.executable, main_py, *sys.argv[1:]])
+
+    request = {"argv": sys.argv[1:], "env": dict(os.environ), "cwd": os.getcwd()}
+    payload = json.dumps(request).encode()
+    forwarded = []
+
+    # The command runs in the daemon's session, so terminal signals such as
+    # Ctrl-C only reach this process; pass them on over the socket.
+    def forward(signum, frame):
+        forwarded.append(signum)
+        try:
+            sock.send(bytes([signum]))
+        except OSError:
+            pass
+
+    with sock:
+        socket.send_fds(sock, [struct.pack("!I", len(payload))], [0, 1, 2])
+        sock.sendall(payload)
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, forward)
+        reply = b"".join(iter(lambda: sock.recv(64), b""))
+
+    if reply:
+        return int(reply)
+    # No reply: the command was killed by a forwarded signal, or died.
+    return 128 + forwarded[-1] if forwarded else 1
+
+if __name__ == "__main__":
+    sys.exit(main())